@@ -15,7 +15,7 @@ class Config:
 
     def __init__(self, config_file=None):
         self.file = config_file
-        self.missing_functions = []
+        self.missing_functions = frozenset()
 
         if config_file is None:
             return
@@ -25,9 +25,9 @@ class Config:
             return
 
         config_data = parse.parse_json_file(config_file)
-        self.missing_functions = config_data.get(EXPECTED_MISSING, [])
+        self.missing_functions = frozenset(config_data.get(EXPECTED_MISSING, []))
 
     def expected_missing_functions(self):
-        """Return list of expected missing functions."""
+        """Return set of expected missing functions."""
 
         return self.missing_functions
@@ -66,13 +66,10 @@ class Status(enum.Enum):
 
         # TODO: a JSONEncoder for Status enums so json.dumps(Status.HIT) works
 
-        if self == Status.HIT:
-            return "hit"
-        if self == Status.MISSED:
-            return "missed"
-        if self == Status.BOTH:
-            return "both"
-        raise UserWarning(f"Found unknown line coverage status: {self}")
+        try:
+            return STATUS_STRINGS[self]
+        except KeyError:
+            raise UserWarning(f"Found unknown line coverage status: {self}") from None
 
     def __str__(self):
         """A string representation of line coverage"""
@@ -87,13 +84,15 @@ class Status(enum.Enum):
         if isinstance(status, Status):
             return status
 
-        if status.lower() == "hit":
-            return Status.HIT
-        if status.lower() == "missed":
-            return Status.MISSED
-        if status.lower() == "both":
-            return Status.BOTH
-        raise UserWarning(f"Found unknown line coverage status: {status}")
+        # look up the common spellings before converting case
+        try:
+            return STATUS_NAMES[status]
+        except KeyError:
+            pass
+        try:
+            return STATUS_NAMES[status.lower()]
+        except KeyError:
+            raise UserWarning(f"Found unknown line coverage status: {status}") from None
 
     def combine(self, status):
         """Combine line coverage"""
@@ -109,6 +108,15 @@ class Status(enum.Enum):
             return self
         return Status.BOTH
 
+# Line coverage status strings written to json
+STATUS_STRINGS = {Status.HIT: "hit", Status.MISSED: "missed", Status.BOTH: "both"}
+
+# Line coverage status names: json uses lower case, enum names are upper case
+STATUS_NAMES = {
+    "hit": Status.HIT, "missed": Status.MISSED, "both": Status.BOTH,
+    "HIT": Status.HIT, "MISSED": Status.MISSED, "BOTH": Status.BOTH
+}
+
 ################################################################
 # Line coverage validator
 
@@ -176,15 +184,14 @@ class Coverage:
         # TODO: distinguish between coverage of source code and proof code
 
         self.coverage = merge_coverage_data(coverage_list)
-        self.line_coverage = extract_line_coverage(self.coverage)
-        self.function_coverage = extract_function_coverage(self.coverage)
-        self.overall_coverage = extract_overall_coverage(self.function_coverage)
+        (self.line_coverage,
+         self.function_coverage,
+         self.overall_coverage) = extract_coverage(self.coverage)
         self.validate()
 
     def __repr__(self):
         """A dict representation of line coverage"""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -239,15 +246,13 @@ def merge_coverage_data(coverage_list):
                              "root: skipping %s", filename)
                 continue
 
-            coverage[filename] = coverage.get(filename, {})
+            file_data = coverage.setdefault(filename, {})
             # function -> line data
             for func, line_data in function_data.items():
-                coverage[filename][func] = coverage[filename].get(func, {})
+                func_data = file_data.setdefault(func, {})
                 # line -> coverage status
                 for line, status in line_data.items():
-                    cov = coverage[filename][func].get(line)
-                    cov = Status.new(status).combine(cov)
-                    coverage[filename][func][line] = cov
+                    func_data[line] = Status.new(status).combine(func_data.get(line))
 
     try:
         coverage and RAW_COVERAGE_DATA(coverage)
@@ -256,65 +261,46 @@ def merge_coverage_data(coverage_list):
     return coverage
 
 
-# line_coverage: file name -> line number -> status
-def extract_line_coverage(coverage):
-    """Extract line coverage from raw coverage data."""
+# Extract line, function, and overall coverage in a single pass:
+#   line_coverage: file name -> line number -> status
+#   function_coverage: file name -> function name -> (percentage, hit, total)
+#   overall_coverage: (percentage, hit, total)
+def extract_coverage(coverage):
+    """Extract line, function, and overall coverage from raw coverage data."""
 
     line_coverage = {}
-    # file name -> function data
-    for filename, function_data in coverage.items():
-        line_coverage[filename] = {}
-        # function -> line data
-        for _, line_data in function_data.items():
-            # line -> coverage status
-            for line, status in line_data.items():
-                line_coverage[filename][line] = status
-    return line_coverage
-
-# function_coverage: file name -> function name -> (percentage, hit, total)
-def extract_function_coverage(coverage):
-    """Extract function coverage from raw coverage data."""
-
     function_coverage = {}
+    overall_hit = 0
+    overall_total = 0
     # file name -> function data
     for filename, function_data in coverage.items():
-        function_coverage[filename] = {}
+        file_line_coverage = line_coverage[filename] = {}
+        file_function_coverage = function_coverage[filename] = {}
         # function name -> line data
         for function, line_data in function_data.items():
             hit = 0
-            total = 0
             # line number -> coverage status
-            for _, status in line_data.items():
-                hit = hit + 1 if status != Status.MISSED else hit
-                total = total + 1
-            percentage = float(hit)/float(total) if total else 0.0
-            function_coverage[filename][function] = {
-                'percentage': percentage,
+            for line, status in line_data.items():
+                file_line_coverage[line] = status
+                if status != Status.MISSED:
+                    hit += 1
+            total = len(line_data)
+            file_function_coverage[function] = {
+                'percentage': float(hit)/float(total) if total else 0.0,
                 'hit': hit,
                 'total': total
             }
-    return function_coverage
-
-# overall_coverage: (percentage, hit, total)
-def extract_overall_coverage(function_coverage):
-    """Extract overall coverage from function coverage data."""
+            overall_hit += hit
+            overall_total += total
 
     if not function_coverage:
-        return {}
+        return line_coverage, function_coverage, {}
 
-    hit = 0
-    total = 0
-    # file name -> function data
-    for _, function_data in function_coverage.items():
-        # function name -> coverage data
-        for _, lines_covered in function_data.items():
-            hit += lines_covered['hit']
-            total += lines_covered['total']
-    percentage = float(hit)/float(total) if total else 0.0
-    return {
-        'percentage': percentage,
-        'hit': hit,
-        'total': total
+    return line_coverage, function_coverage, {
+        'percentage':
+        float(overall_hit)/float(overall_total) if overall_total else 0.0,
+        'hit': overall_hit,
+        'total': overall_total
     }
 
 ################################################################
@@ -354,13 +340,14 @@ def repair_json(coverage):
     #   func_data: line -> status
     # but json represents both line and status as strings
 
-    fix_func = lambda func_data: {int(line_): Status.new(line_data_)
-                                  for line_, line_data_ in func_data.items()}
-    fix_file = lambda file_data: {func_: fix_func(func_data_)
-                                  for func_, func_data_ in file_data.items()}
-    fix_proj = lambda proj_data: {file_: fix_file(file_data_)
-                                  for file_, file_data_ in proj_data.items()}
-    return fix_proj(coverage)
+    return {
+        file_: {
+            func_: {int(line_): Status.new(status_)
+                    for line_, status_ in func_data.items()}
+            for func_, func_data in file_data.items()
+        }
+        for file_, file_data in coverage.items()
+    }
 
 ################################################################
 # Coverage from json output of cbmc
@@ -471,33 +458,28 @@ def relative_locations(locations, wkdir, root):
     # result is a source location that has no valid relative form.  We
     # ignore them when generating coverage data.
 
-    def relative_location(loc_file, loc_func, loc_line):
-        """The source location relative to the source root."""
+    relative = []
+    for loc_file, loc_func, loc_line in locations:
         try:
-            return (
+            relative.append((
                 srcloct.make_relative_path(loc_file, root, wkdir),
                 loc_func,
                 loc_line
-            )
+            ))
         except AssertionError: # raised by make_relative_path
             logging.debug(
                 "Ignoring an invalid source location in coverage data:"
                 " {file: %s, function: %s, line: %s}",
                 loc_file, loc_func, loc_line
             )
-            return None
-
-    locations = [relative_location(*loc) for loc in locations]
-    locations = [loc for loc in locations if loc is not None]
-    return locations
+    return relative
 
 def update_coverage(coverage, path, func, line, status):
     """Add to coverage the coverage status of a single line"""
 
-    coverage[path] = coverage.get(path, {})
-    coverage[path][func] = coverage[path].get(func, {})
-    coverage[path][func][line] = coverage[path][func].get(line, status)
-    coverage[path][func][line] = coverage[path][func][line].combine(status)
+    line_data = coverage.setdefault(path, {}).setdefault(func, {})
+    old_status = line_data.get(line)
+    line_data[line] = status if old_status is None else old_status.combine(status)
     return coverage
 
 ################################################################
@@ -535,15 +517,17 @@ def parse_lines(string):
         set_incomplete_coverage()
         return []
 
+BLOCK_DESCRIPTION = re.compile(r'block [0-9]+ \(lines (.*)\)')
+
 def parse_description(description):
     """The source locations in the basic block encoded by a coverage goal description"""
 
     try:
         # description is "block N (lines BASIC_BLOCK)"
-        basic_block = re.match(r'block [0-9]+ \(lines (.*)\)', description).group(1)
-
-        if basic_block is None:
+        match = BLOCK_DESCRIPTION.match(description)
+        if match is None:
             raise ValueError
+        basic_block = match.group(1)
 
         # basic_block is
         #   chunk1;chunk2;chunk3
@@ -557,7 +541,7 @@ def parse_description(description):
             func, lines = func_lines.rsplit(':', 1) # func:lines -> func,lines
             for line in parse_lines(lines):
                 if fyle and func and line:
-                    lines.append((fyle, func, line))
+                    srclocs.append((fyle, func, line))
                 else:
                     logging.info(
                         'Skipping malformed source location in coverage goal description: %s: '
@@ -650,9 +634,10 @@ def make_coverage(args):
         fail(f"Expected json files: {viewer_coverage}")
 
     if cbmc_coverage and srcdir:
-        if filet.all_json_files(cbmc_coverage):
+        file_type = filet.common_filetype(cbmc_coverage)
+        if file_type == filet.File.JSON:
             return CoverageFromCbmcJson(cbmc_coverage, srcdir)
-        if filet.all_xml_files(cbmc_coverage):
+        if file_type == filet.File.XML:
             return CoverageFromCbmcXml(cbmc_coverage, srcdir)
         fail(f"Expected json files or xml files, not both: {cbmc_coverage}")
 
@@ -15,6 +15,15 @@ class File(enum.Enum):
     XML = 2
     JSON = 3
 
+# The file type denoted by a filename extension
+FILE_EXTENSIONS = {
+    'log': File.TEXT,
+    'txt': File.TEXT,
+    'jsn': File.JSON,
+    'json': File.JSON,
+    'xml': File.XML
+}
+
 def filetype(filename):
     """Return the file type denoted by the filename extension."""
 
@@ -29,13 +38,7 @@ def filetype(filename):
 
     # Return the file type
     try:
-        return {
-            'log': File.TEXT,
-            'txt': File.TEXT,
-            'jsn': File.JSON,
-            'json': File.JSON,
-            'xml': File.XML
-        }[file_extension]
+        return FILE_EXTENSIONS[file_extension]
     except KeyError:
         raise UserWarning(
             f"Can't determine file type of file {filename}"
@@ -67,4 +70,10 @@ def any_text_files(txts):
     """Any of the files are text files."""
     return any(is_text_file(txt) for txt in txts)
 
+def common_filetype(filenames):
+    """Return the file type shared by all of the files, or None if none is."""
+
+    filetypes = {filetype(filename) for filename in filenames}
+    return filetypes.pop() if len(filetypes) == 1 else None
+
 ################################################################
@@ -19,6 +19,10 @@ from cbmc_viewer import util
 
 JSON_TAG = 'viewer-loop'
 
+# CBMC refers to the loop K in function FCN as FCN.K and to the
+# unwinding assertion associated with that loop as FCN.unwind.K
+UNWINDING_ASSERTION = re.compile(r'^(.*)\.unwind\.([0-9]+)$')
+
 ################################################################
 # Loop validator
 
@@ -55,7 +59,6 @@ class Loop:
     def __repr__(self):
         """A dict representation of the loop table."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -124,7 +127,8 @@ class Loop:
         # but the goto-cc --export-file-local-symbols flag renames FCN.K
         # appearing in a file FILE in a static function FCN as
         # __CPROVER_file_local_FILE_FCN_LOOP.N
-        keys = [key for key in self.loops.keys() if key.endswith('_'+name)]
+        suffix = '_' + name
+        keys = [key for key in self.loops if key.endswith(suffix)]
         if not keys:
             return None
         if len(keys) != 1:
@@ -135,10 +139,7 @@ class Loop:
     def lookup_assertion(self, name):
         """Look up the srcloc for the named loop unwinding assertion."""
 
-        # CBMC refers to the loop K in function FCN as FCN.K and to
-        # the unwinding assertion associated with that loop as
-        # FCN.unwind.K
-        match = re.match(r'^(.*)\.unwind\.([0-9]+)$', name)
+        match = UNWINDING_ASSERTION.match(name)
         if match is None:
             return None
         loop = f'{match.group(1)}.{match.group(2)}'
@@ -256,9 +257,10 @@ def make_loop(args):
         fail(f"Expected json files: {viewer_loop}")
 
     if cbmc_loop and srcdir:
-        if filet.all_json_files(cbmc_loop):
+        file_type = filet.common_filetype(cbmc_loop)
+        if file_type == filet.File.JSON:
             return LoopFromCbmcJson(cbmc_loop, srcdir)
-        if filet.all_xml_files(cbmc_loop):
+        if file_type == filet.File.XML:
             return LoopFromCbmcXml(cbmc_loop, srcdir)
         fail(f"Expected json files or xml files, not both: {cbmc_loop}")
 
@@ -75,7 +75,8 @@ class Code:
         self.filename = path
         self.path_to_root = markup_link.path_to_file('.', path)
         self.outdir = outdir
-        self.validate()
+        if util.debugging():
+            self.validate()
 
     def __str__(self):
         """Render annotated code as html."""
@@ -94,9 +95,11 @@ class Code:
     def dump(self, filename=None, outdir=None):
         """Write annotated code to a file rendered as html."""
 
-        util.dump(self,
-                  filename or self.filename + ".html",
-                  outdir or self.outdir)
+        util.dump_stream(templates.stream_code(self.filename,
+                                               self.path_to_root,
+                                               self.lines),
+                         filename or self.filename + ".html",
+                         outdir or self.outdir)
 
 ################################################################
 # Untabify code: replace tabs with spaces.
@@ -108,12 +111,15 @@ def untabify_code(code, tabstop=8):
         [untabify_line(line, tabstop) for line in code.splitlines()]
     )
 
+# Split a line at its tabs, keeping the tabs
+TAB = re.compile('(\t)')
+
 def untabify_line(line, tabstop=8):
     """Untabify a line of code."""
 
     strings = []
     length = 0
-    for string in re.split('(\t)', line):
+    for string in TAB.split(line):
         if string == '\t':
             string = ' '*(tabstop - (length % tabstop))
         length += len(string)
@@ -207,16 +213,7 @@ def link_symbols_in_code_block(path, block, symbols):
 def link_symbols(path, code, symbols):
     """Link symbols appearing a code string."""
 
-    tokens = split_code_into_symbols(code)
-    return ''.join(
-        [markup_link.link_text_to_symbol(tkn, tkn, symbols, from_file=path, escape_text=False)
-         for tkn in tokens]
-    )
-
-def split_code_into_symbols(code):
-    """Split a code string into a list of symbols and nonsymbols."""
-
-    return re.split('([_a-zA-Z][_a-zA-Z0-9]*)', code)
+    return markup_link.link_symbols_in_text(code, symbols, from_file=path, escape_text=False)
 
 ################################################################
 # Annotate lines of symbol-linked code with line numbers and coverage
@@ -10,6 +10,7 @@ assumed to be relative to the root of the source code.
 
 """
 
+import functools
 import html
 import os
 import re
@@ -18,6 +19,10 @@ from cbmc_viewer import srcloct
 
 ################################################################
 
+# A page links to the same few files over and over (every use of a
+# symbol links to the file defining the symbol), so cache the paths.
+
+@functools.lru_cache(maxsize=None)
 def path_to_file(dst, src):
     """The path from src to dst for use in a hyperlink from src to dst.
 
@@ -98,10 +103,8 @@ def link_text_to_symbol(text, symbol, symbols, from_file=None, escape_text=True)
     srcloc = symbols.lookup(symbol)
     return link_text_to_srcloc(text, srcloc, from_file, escape_text=escape_text)
 
-def split_text_into_symbols(text):
-    """Split text into substrings that could be symbols."""
-
-    return re.split('([_a-zA-Z][_a-zA-Z0-9]*)', text)
+# A string that could be a symbol
+SYMBOL = re.compile('[_a-zA-Z][_a-zA-Z0-9]*')
 
 def link_symbols_in_text(text, symbols, from_file=None, escape_text=True):
     """Link symbols appearing in text to their definitions."""
@@ -109,10 +112,24 @@ def link_symbols_in_text(text, symbols, from_file=None, escape_text=True):
     if text is None:
         return None
 
-    tokens = split_text_into_symbols(text)
-    return ''.join(
-        [link_text_to_symbol(tkn, tkn, symbols, from_file, escape_text)
-         for tkn in tokens]
-    )
+    def link_symbol(match):
+        """Link a symbol to its definition."""
+
+        # A symbol contains no characters that html would escape
+        symbol = match.group(0)
+        return link_text_to_symbol(symbol, symbol, symbols, from_file, escape_text=False)
+
+    if not escape_text:
+        return SYMBOL.sub(link_symbol, text)
+
+    # Escape the text between the symbols, too
+    linked = []
+    end = 0
+    for match in SYMBOL.finditer(text):
+        linked.append(html.escape(text[end:match.start()]))
+        linked.append(link_symbol(match))
+        end = match.end()
+    linked.append(html.escape(text[end:]))
+    return ''.join(linked)
 
 ################################################################
@@ -3,6 +3,8 @@
 
 """Proof summary."""
 
+import re
+
 import voluptuous
 import voluptuous.humanize
 
@@ -76,26 +78,31 @@ class Summary:
                  config, outdir='.'):
         # pylint: disable=too-many-arguments
 
+        expected_missing, unexpected_missing, other_warning = classify_warnings(
+            results, config.expected_missing_functions()
+        )
+        property_failure, loop_failure, other_failure = classify_failures(
+            results, properties, loops, symbols
+        )
         self.summary = {
             'coverage': {
                 'overall': overall_coverage(coverage),
                 'function': function_coverage(coverage, symbols)
             },
             'warnings': {
-                'expected_missing_function':
-                    expected_missing_functions(results, config),
-                'unexpected_missing_function':
-                    unexpected_missing_functions(results, config),
-                'other': other_warnings(results)
+                'expected_missing_function': expected_missing,
+                'unexpected_missing_function': unexpected_missing,
+                'other': other_warning
             },
             'failures': {
-                'property': property_failures(results, properties, symbols),
-                'loop': loop_failures(results, loops),
-                'other': other_failures(results, properties, loops)
+                'property': property_failure,
+                'loop': loop_failure,
+                'other': other_failure
             }
         }
         self.outdir = outdir
-        self.validate()
+        if util.debugging():
+            self.validate()
 
     def __str__(self):
         """Render the proof summary as html."""
@@ -112,7 +119,9 @@ class Summary:
     def dump(self, filename=None, outdir=None):
         """Write the proof summary to a file rendered as html."""
 
-        util.dump(self, filename or "index.html", outdir or self.outdir)
+        util.dump_stream(templates.stream_summary(self.summary),
+                         filename or "index.html",
+                         outdir or self.outdir)
 
 ################################################################
 # Coverage data
@@ -133,6 +142,12 @@ def overall_coverage(coverage):
 def function_coverage(coverage, symbols):
     """Function proof coverage."""
 
+    def function_line(func_name):
+        """Line number of a function definition (0 if not in symbol table)."""
+
+        srcloc = symbols.lookup(func_name)
+        return srcloc.get("line") if srcloc else 0
+
     return [
         {
             'percentage': func_cov['percentage'],
@@ -140,7 +155,7 @@ def function_coverage(coverage, symbols):
             'total': func_cov['total'],
             'file_name': file_name,
             'func_name': func_name,
-            'line_num': symbols.lookup(func_name).get("line") if symbols.lookup(func_name) else 0
+            'line_num': function_line(func_name)
         }
         for file_name, file_data in coverage.function_coverage.items()
         for func_name, func_cov in file_data.items()
@@ -151,51 +166,51 @@ def function_coverage(coverage, symbols):
 
 # TODO: This classification of warnings should be done by make-results
 
-def warnings(results):
-    """Proof warnings."""
-
-    prefixes = ["**** WARNING:", "warning:"]
-
-    def strip_prefixes(string, prefixes):
-        """Strip warning prefixes from a warning string."""
-
-        for prefix in prefixes:
-            if string.startswith(prefix):
-                return string[len(prefix):].strip()
-        return string
-
-    return [strip_prefixes(warning, prefixes) for warning in results.warning]
-
-def missing_functions(messages):
-    """Names of missing functions."""
+# A warning with an optional warning prefix, and the name of the
+# function when the warning is about a missing function.  The pattern
+# matches every string, so classifying a warning takes one match.
+WARNING = re.compile(
+    r'(?:(?:\*\*\*\* WARNING:|warning:)\s*)?'
+    r'(?:no body for function(?P<function>.*))?',
+    re.DOTALL
+)
+
+def classify_warnings(results, expected_missing=()):
+    """Proof warnings classified in a single pass over the warnings.
+
+    Return the names of missing functions expected to be missing, the
+    names of missing functions not expected to be missing, and the
+    warnings unrelated to missing functions.
+    """
 
-    prefix = "no body for function"
-    length = len(prefix)
-    return [warning[length:].strip() for warning in messages
-            if warning.startswith(prefix)]
+    expected, unexpected, other = [], [], []
+    for warning in results.warning:
+        match = WARNING.match(warning)
+        function = match.group('function')
+        if function is None:
+            other.append(warning[match.end():].strip())
+            continue
+        function = function.strip()
+        if function in expected_missing:
+            expected.append(function)
+        else:
+            unexpected.append(function)
+    return expected, unexpected, other
 
 def expected_missing_functions(results, config):
     """Names of missing functions expected to be missing."""
 
-    return [
-        function for function in missing_functions(warnings(results))
-        if function in config.expected_missing_functions()
-    ]
+    return classify_warnings(results, config.expected_missing_functions())[0]
 
 def unexpected_missing_functions(results, config):
     """Names of missing functions not expected to be missing."""
 
-    return [
-        function for function in missing_functions(warnings(results))
-        if function not in config.expected_missing_functions()
-    ]
+    return classify_warnings(results, config.expected_missing_functions())[1]
 
 def other_warnings(results):
     """Warnings unrelated to missing functions."""
 
-    prefix = "no body for function"
-    return [warning.strip() for warning in warnings(results)
-            if not warning.startswith(prefix)]
+    return classify_warnings(results)[2]
 
 ################################################################
 # Failure data
@@ -234,41 +249,25 @@ def loop_definition(prop_name, loops):
         'line_num': srcloc['line']
     }
 
-def other_definition(prop_name, properties, loops):
-    """Name of an unrecognized failure."""
-
-    if properties.lookup(prop_name) or loops.lookup_assertion(prop_name):
-        return None
-    return prop_name
-
-def filter_none(items):
-    """Remove instances of None from a list of items."""
+def classify_failures(results, properties, loops, symbols):
+    """Proof failures classified in a single pass over the failures.
 
-    return [item for item in items if item is not None]
-
-def property_failures(results, properties, symbols):
-    """Details for property failures."""
-
-    failures = results.results[False]
-    return filter_none(
-        [property_definition(failure, properties, symbols)
-         for failure in failures]
-    )
-
-def loop_failures(results, loops):
-    """Details for loop unwinding assertion failures."""
-
-    failures = results.results[False]
-    return filter_none(
-        [loop_definition(failure, loops) for failure in failures]
-    )
-
-def other_failures(results, properties, loops):
-    """Names of unrecognized failures."""
+    Return the details for property failures, the details for loop
+    unwinding assertion failures, and the names of unrecognized
+    failures.  A failure may be both a property failure and a loop
+    unwinding assertion failure.
+    """
 
-    failures = results.results[False]
-    return filter_none(
-        [other_definition(failure, properties, loops) for failure in failures]
-    )
+    property_failures, loop_failures, other_failures = [], [], []
+    for failure in results.results[False]:
+        prop_def = property_definition(failure, properties, symbols)
+        loop_def = loop_definition(failure, loops)
+        if prop_def is not None:
+            property_failures.append(prop_def)
+        if loop_def is not None:
+            loop_failures.append(loop_def)
+        if prop_def is None and loop_def is None:
+            other_failures.append(failure)
+    return property_failures, loop_failures, other_failures
 
 ################################################################
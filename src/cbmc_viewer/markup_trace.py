@@ -48,16 +48,29 @@ VALID_TRACE = voluptuous.Schema({
 ################################################################
 # Source code fragments used to annotate traces.
 
+WHITESPACE = re.compile(r'\s+')
+
 class CodeSnippet:
     """Source code fragments."""
 
     def __init__(self, root):
-        self.root = root  # source root
-        self.source = {}  # cache mapping file name -> lines of source code
+        self.root = root    # source root
+        self.source = {}    # cache mapping file name -> lines of source code
+        self.snippets = {}  # cache mapping (file name, line) -> snippet
 
     def lookup(self, path, line):
         """A line of source code."""
 
+        # Traces step through the same lines over and over (loops,
+        # common function calls), so format each snippet only once.
+        key = (path, line)
+        if key not in self.snippets:
+            self.snippets[key] = self.snippet(path, line)
+        return self.snippets[key]
+
+    def snippet(self, path, line):
+        """The statement of source code beginning at a line."""
+
         if line <= 0: # line numbers are 1-based
             logging.info("CodeSnippet lookup: line number not positive: %s", line)
             return None
@@ -74,7 +87,7 @@ class CodeSnippet:
 
         # return the whole statement which may be broken over several lines
         snippet = ' '.join(self.source[path][line:line+5])
-        snippet = re.sub(r'\s+', ' ', snippet).strip()
+        snippet = WHITESPACE.sub(' ', snippet).strip()
         idx = snippet.find(';')     # end of statement
         if idx >= 0:
             return html.escape(snippet[:idx+1])
@@ -109,7 +122,8 @@ class Trace:
             'cbmc': format_step(step)
         } for num, step in enumerate(trace)]
         self.outdir = outdir
-        self.validate()
+        if util.debugging():
+            self.validate()
 
     def __str__(self):
         """Render annotated trace as html."""
@@ -129,13 +143,20 @@ class Trace:
     def dump(self, filename=None, outdir=None):
         """Write annotated trace to a file rendered as html."""
 
-        util.dump(self,
-                  filename or self.prop_name + ".html",
-                  outdir or self.outdir)
+        util.dump_stream(templates.stream_trace(self.prop_name,
+                                                self.prop_desc,
+                                                self.prop_srcloc,
+                                                self.steps),
+                         filename or self.prop_name + ".html",
+                         outdir or self.outdir)
 
 ################################################################
 # Format a source location
 
+# A file in the trace directory to link from (any name foo.html will do).
+# Warning: this assumes trace root is subdirectory of code root
+TRACE_FILE = os.path.join(TRACES, 'foo.html')
+
 def format_srcloc(srcloc, symbols):
     """Format a source location for a trace step."""
 
@@ -144,31 +165,14 @@ def format_srcloc(srcloc, symbols):
 
     fyle, func, line = srcloc['file'], srcloc['function'], srcloc['line']
     func_srcloc = symbols.lookup(func)
-    # Warning: next line assumes trace root is subdirectory of code root
-    from_file = os.path.join(TRACES, 'foo.html') # any name foo.html will do
-    # pylint: disable=consider-using-f-string
-    return 'Function {}, File {}, Line {}'.format(
-        markup_link.link_text_to_srcloc(func, func_srcloc, from_file),
-        markup_link.link_text_to_file(fyle, fyle, from_file),
-        markup_link.link_text_to_line(line, fyle, line, from_file)
-    )
+    func_link = markup_link.link_text_to_srcloc(func, func_srcloc, TRACE_FILE)
+    file_link = markup_link.link_text_to_file(fyle, fyle, TRACE_FILE)
+    line_link = markup_link.link_text_to_line(line, fyle, line, TRACE_FILE)
+    return f'Function {func_link}, File {file_link}, Line {line_link}'
 
 ################################################################
 # Format a trace step
 
-def format_step(step):
-    """Format a trace step."""
-
-    markup = {
-        "function-call": format_function_call,
-        "function-return": format_function_return,
-        "variable-assignment": format_variable_assignment,
-        "parameter-assignment": format_parameter_assignment,
-        "assumption": format_assumption,
-        "failure": format_failure
-    }[step['kind']]
-    return markup(step)
-
 def format_function_call(step):
     """Format a function call."""
 
@@ -213,4 +217,19 @@ def format_failure(step):
     reason = step['detail']['reason'] or "Not given"
     return f'failure: {prop}: {reason}'
 
+# The formatter for each kind of trace step
+STEP_FORMATTERS = {
+    "function-call": format_function_call,
+    "function-return": format_function_return,
+    "variable-assignment": format_variable_assignment,
+    "parameter-assignment": format_parameter_assignment,
+    "assumption": format_assumption,
+    "failure": format_failure
+}
+
+def format_step(step):
+    """Format a trace step."""
+
+    return STEP_FORMATTERS[step['kind']](step)
+
 ################################################################
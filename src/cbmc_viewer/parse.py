@@ -9,6 +9,12 @@ import xml.etree.cElementTree as ElementTree
 import json
 import logging
 
+# orjson is an optional, faster json parser for large cbmc output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def parse_xml_file(xfile):
     """Parse an xml file."""
 
@@ -31,12 +37,37 @@ def parse_json_file(jfile):
     """Parse an json file."""
 
     try:
-        with open(jfile, encoding='utf-8') as data:
-            return json.load(data)
+        if orjson is None:
+            with open(jfile, encoding='utf-8') as data:
+                return json.load(data)
+        with open(jfile, 'rb') as data:
+            text = data.read()
+        try:
+            return orjson.loads(text) # pylint: disable=no-member
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError,
+            # and orjson is stricter than json (eg, NaN and big integers)
+            return json.loads(text)
     except (IOError, json.JSONDecodeError) as err:
         logging.debug("%s", err)
         raise UserWarning(f"Can't load json file '{jfile}' in {Path.cwd()}") from None
 
+def parse_file_once(parser, path, parsed=None):
+    """Parse a file with parser, reusing data parsed earlier in this run.
+
+    The viewer builds both the results and the traces from the cbmc
+    property checking output.  The dict parsed maps file names to
+    parsed data and is shared by the callers reading the same files,
+    so each file is parsed once.  Callers sharing it must not modify
+    the parsed data.
+    """
+
+    if parsed is None:
+        return parser(path)
+    if path not in parsed:
+        parsed[path] = parser(path)
+    return parsed[path]
+
 def parse_json_string(jstr):
     """Parse a json string."""
 
@@ -75,7 +75,6 @@ class Property:
     def __repr__(self):
         """A dict representation of an property table."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -216,9 +215,10 @@ def make_property(args):
         fail(f"Expected json files: {viewer_property}")
 
     if cbmc_property and srcdir:
-        if filet.all_json_files(cbmc_property):
+        file_type = filet.common_filetype(cbmc_property)
+        if file_type == filet.File.JSON:
             return PropertyFromCbmcJson(cbmc_property, srcdir)
-        if filet.all_xml_files(cbmc_property):
+        if file_type == filet.File.XML:
             return PropertyFromCbmcXml(cbmc_property, srcdir)
         fail(f"Expected json files or xml files, not both: {cbmc_property}")
 
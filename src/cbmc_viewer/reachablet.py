@@ -49,7 +49,6 @@ class Reachable:
     def __repr__(self):
         """A dict representation of the reachable functions."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -79,8 +78,7 @@ class Reachable:
         functions = {}
         for function_list in function_lists:
             for file_name, func_names in function_list.items():
-                functions[file_name] = functions.get(file_name, set())
-                functions[file_name] = functions[file_name].union(func_names)
+                functions.setdefault(file_name, set()).update(func_names)
 
         return functions
 
@@ -132,6 +130,7 @@ def parse_cbmc_json(json_data, root):
 
     root = srcloct.abspath(root)
     reachable = {}
+    paths = {}
     for function in json_data:
         func_name = function['function']
         if func_name.startswith('__CPROVER'):
@@ -149,18 +148,27 @@ def parse_cbmc_json(json_data, root):
                             function)
             continue
 
-        file_name = srcloct.abspath(file_name)
-        if srcloct.is_builtin(file_name):
-            continue
-        if not file_name.startswith(root):
+        # Many functions share a source file, so resolve each file once
+        if file_name not in paths:
+            paths[file_name] = source_path(file_name, root)
+        path = paths[file_name]
+        if path is None:
             continue
 
-        path = srcloct.relpath(file_name, root)
-        reachable[path] = reachable.get(path, set())
-        reachable[path].add(func_name)
+        reachable.setdefault(path, set()).add(func_name)
 
     return reachable
 
+def source_path(file_name, root):
+    """Path to a source file relative to root, or None if not under root."""
+
+    file_name = srcloct.abspath(file_name)
+    if srcloct.is_builtin(file_name):
+        return None
+    if not file_name.startswith(root):
+        return None
+    return srcloct.relpath(file_name, root)
+
 ################################################################
 
 class ReachableFromCbmcXml(Reachable):
@@ -221,9 +229,10 @@ def make_reachable(args):
         fail(f"Expected json files: {viewer_reachable}")
 
     if cbmc_reachable and srcdir:
-        if filet.all_json_files(cbmc_reachable):
+        file_type = filet.common_filetype(cbmc_reachable)
+        if file_type == filet.File.JSON:
             return ReachableFromCbmcJson(cbmc_reachable, srcdir)
-        if filet.all_xml_files(cbmc_reachable):
+        if file_type == filet.File.XML:
             return ReachableFromCbmcXml(cbmc_reachable, srcdir)
         fail(f"Expected json files or xml files, not both: {cbmc_reachable}")
 
@@ -7,8 +7,6 @@ import logging
 import os
 import shutil
 
-import pkg_resources
-
 from cbmc_viewer import markup_code
 from cbmc_viewer import markup_summary
 from cbmc_viewer import markup_trace
@@ -29,6 +27,10 @@ def report(config, sources, symbols, results, coverage, traces, properties,
     # The report is assembled from many sources of data
     # pylint: disable=too-many-locals
 
+    # pkg_resources is slow to import and only the report needs it
+    # pylint: disable=import-outside-toplevel
+    import pkg_resources
+
     # Some code depends on these definitions
     #   * links to traces in summary produced with jinja summary template
     #   * links to sources in traces produced by markup_trace
@@ -85,7 +85,6 @@ class Result:
     def __repr__(self):
         """A dict representation of results."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -147,9 +146,9 @@ class ResultFromCbmcText(Result):
 class ResultFromCbmcJson(Result):
     """CBMC property checking results loaded from cbmc json output"""
 
-    def __init__(self, json_files):
+    def __init__(self, json_files, parsed=None):
         super().__init__(
-            [parse_cbmc_json_results(json_file) for json_file in json_files]
+            [parse_cbmc_json_results(json_file, parsed) for json_file in json_files]
         )
 
 ################################################################
@@ -158,9 +157,9 @@ class ResultFromCbmcJson(Result):
 class ResultFromCbmcXml(Result):
     """CBMC property checking results loaded from CBMC xml output"""
 
-    def __init__(self, xml_files):
+    def __init__(self, xml_files, parsed=None):
         super().__init__(
-            [parse_cbmc_xml_results(xml_file) for xml_file in xml_files]
+            [parse_cbmc_xml_results(xml_file, parsed) for xml_file in xml_files]
         )
 
 ################################################################
@@ -245,10 +244,10 @@ def parse_cbmc_text_results(text_file):
 
     return results
 
-def parse_cbmc_json_results(json_file):
+def parse_cbmc_json_results(json_file, parsed=None):
     """Parse json output of cbmc property checking"""
 
-    blob = parse.parse_json_file(json_file)
+    blob = parse.parse_file_once(parse.parse_json_file, json_file, parsed)
     if blob is None:
         return EMPTY_RESULT
 
@@ -261,10 +260,10 @@ def parse_cbmc_json_results(json_file):
 
     return results
 
-def parse_cbmc_xml_results(xml_file):
+def parse_cbmc_xml_results(xml_file, parsed=None):
     """Parse xml output of cbmc property checking"""
 
-    blob = parse.parse_xml_file(xml_file)
+    blob = parse.parse_file_once(parse.parse_xml_file, xml_file, parsed)
     if blob is None:
         return EMPTY_RESULT
 
@@ -417,14 +416,16 @@ def cbmc_xml_warnings(blob):
 
 EMPTY_RESULT_RESULTS = {True: [], False: []}
 
+# Lines given property checking results have the form
+# [name] srcloc description: SUCCESS|FAILURE|UNKNOWN
+TEXT_RESULT = re.compile(r'\[([^ ]*)\].*: ((FAILURE)|(SUCCESS)|(UNKNOWN))')
+
 def cbmc_text_results(results_section):
     """Find results in cbmc text output"""
 
     results = EMPTY_RESULT_RESULTS
     for line in results_section:
-        # Lines given property checking results have the form
-        # [name] srcloc description: SUCCESS|FAILURE|UNKNOWN
-        match = re.match(r'\[([^ ]*)\].*: ((FAILURE)|(SUCCESS)|(UNKNOWN))', line)
+        match = TEXT_RESULT.match(line)
         if match:
             name, status = match.groups()[:2]
             results[status == 'SUCCESS'].append(name)
@@ -511,8 +512,12 @@ def fail(msg):
     logging.info(msg)
     raise UserWarning(msg)
 
-def make_result(args):
-    """Implementation of make-result."""
+def make_result(args, parsed=None):
+    """Implementation of make-result.
+
+    The optional dict parsed holds cbmc output already parsed by the
+    caller (see parse.parse_file_once).
+    """
 
     viewer_result, cbmc_result = args.viewer_result, args.result
 
@@ -522,12 +527,13 @@ def make_result(args):
         fail(f"Expected a list of json files: {viewer_result}")
 
     if cbmc_result:
-        if filet.all_text_files(cbmc_result):
+        file_type = filet.common_filetype(cbmc_result)
+        if file_type == filet.File.TEXT:
             return ResultFromCbmcText(cbmc_result)
-        if filet.all_json_files(cbmc_result):
-            return ResultFromCbmcJson(cbmc_result)
-        if filet.all_xml_files(cbmc_result):
-            return ResultFromCbmcXml(cbmc_result)
+        if file_type == filet.File.JSON:
+            return ResultFromCbmcJson(cbmc_result, parsed)
+        if file_type == filet.File.XML:
+            return ResultFromCbmcXml(cbmc_result, parsed)
         fail(f"Expected a list of text files, json files, or xml files: {cbmc_result}")
 
     logging.info("make-result: nothing to do: need "
@@ -535,10 +541,10 @@ def make_result(args):
                  "--viewer-result")
     return Result()
 
-def make_and_save_result(args, path=None):
+def make_and_save_result(args, path=None, parsed=None):
     """Make result object and write to file or stdout"""
 
-    obj = make_result(args)
+    obj = make_result(args, parsed)
     util.save(obj, path)
     return obj
 
@@ -21,6 +21,9 @@ from cbmc_viewer import util
 
 JSON_TAG = 'viewer-source'
 
+# The file name in a preprocessor linemarker '# linenum "filename" flags'
+LINEMARKER_FILENAME = re.compile(r'"(.*)"')
+
 ################################################################
 
 class Sources(enum.Enum):
@@ -83,7 +86,6 @@ class Source:
     def __repr__(self):
         """A dict representation of sources."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -312,9 +314,9 @@ class SourceFromMake(Source):
         preprocessed_filenames = self.extract_filenames(preprocessor_commands,
                                                         build)
         logging.debug('preprocessed filenames: %s', preprocessed_filenames)
-        preprocessed_output = self.read_output(preprocessed_filenames)
-        #logging.debug('preprocessed output: %s', preprocessed_output)
-        source_files = self.extract_source_filenames(preprocessed_output, build)
+        linemarkers = self.read_output(preprocessed_filenames)
+        #logging.debug('linemarkers: %s', linemarkers)
+        source_files = self.extract_source_filenames(linemarkers, build)
         logging.debug('source files: %s', source_files)
 
         # Remove preprocessor output
@@ -370,13 +372,22 @@ class SourceFromMake(Source):
 
     @staticmethod
     def read_output(files):
-        """Return the preprocessor output as a list of lines."""
+        """Return the linemarkers in the preprocessor output as a list of lines.
+
+        The preprocessor output can be very large, and only the
+        linemarkers name source files, so stream each file a line at
+        a time and keep only the linemarkers.
+        """
 
+        # NOTE:
+        #   linemarkers have form '# linenum "filename" flags' (space after #)
+        #   directives have form '#directive' (no space after #)
         output = []
         for name in files:
             try:
                 with open(name, encoding='utf-8') as handle:
-                    output.extend(handle.read().splitlines())
+                    output.extend(line.rstrip('\n') for line in handle
+                                  if line.strip().startswith('# '))
             except FileNotFoundError:
                 # The output file for the failed linking step will be in list
                 logging.debug("Can't open '%s', "
@@ -385,25 +396,19 @@ class SourceFromMake(Source):
         return output
 
     @staticmethod
-    def extract_source_filenames(output, build):
-        """Return the list of source files in the preprocessor output.
+    def extract_source_filenames(linemarkers, build):
+        """Return the list of source files named in preprocessor linemarkers.
 
-        The argument output is the preprocesor output given as a list
-        of lines.  The argument build is the directory in
-        which make was invoked.
+        The argument linemarkers is the list of linemarkers in the
+        preprocessor output returned by read_output.  The argument
+        build is the directory in which make was invoked.
 
         Assume that if a source file is not an absolute path, then it
         is a path relative to the build directory.
         """
 
-        # extract linemarkers from preprocessor output
-        # NOTE:
-        #   linemarkers have form '# linenum "filename" flags' (space after #)
-        #   directives have form '#directive' (no space after #)
-        linemarkers = [line for line in output if line.strip().startswith('# ')]
-
         # extract filenames from linemarkers
-        filenames = [re.search(r'"(.*)"', line).group(1)
+        filenames = [LINEMARKER_FILENAME.search(line).group(1)
                      for line in linemarkers]
 
         # skip filenames generated by the preprocessor
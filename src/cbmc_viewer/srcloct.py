@@ -3,6 +3,7 @@
 
 """Manipulate source locations and path names appearing in CBMC output."""
 
+import functools
 import logging
 import os
 import re
@@ -119,6 +120,7 @@ def is_missing(name):
 
 ################################################################
 
+@functools.lru_cache(maxsize=None)
 def file_is_not_a_source_file(name):
     """The file name cannot refer to a source file.
 
@@ -133,6 +135,11 @@ def file_is_not_a_source_file(name):
 
 ################################################################
 
+# Traces and coverage data name the same few source files over and
+# over, so cache the path computations.  A failed assertion is not
+# cached and is raised again on every call.
+
+@functools.lru_cache(maxsize=None)
 def make_relative_path(srcfile, srcdir=None, wkdir=None):
     """The relative path to the source file from the source root.
 
@@ -193,25 +200,28 @@ def make_srcloc(path, func, line, wkdir, root):
         )
         return MISSING_SRCLOC
 
+# Source locations appear in many forms in text output
+STEP_SRCLOC = re.compile('file (.+) function (.+) line ([0-9]+)')
+ASSUMPTION_SRCLOC = re.compile('file (.+) line ([0-9]+) function (.+)')
+INTRINSIC_SRCLOC = re.compile('function (.+) thread')
+
 def text_srcloc(cbmc_srcloc, wkdir=None, root=None):
     """Parse a CBMC source location in text output."""
 
-    # Source locations appear in many forms in text output
-
     # Source location in a step
-    match = re.search('file (.+) function (.+) line ([0-9]+)', cbmc_srcloc)
+    match = STEP_SRCLOC.search(cbmc_srcloc)
     if match:
         path, func, line = match.groups()[:3]
         return make_srcloc(path, func, line, wkdir, root)
 
     # Source location in an assumption
-    match = re.search('file (.+) line ([0-9]+) function (.+)', cbmc_srcloc)
+    match = ASSUMPTION_SRCLOC.search(cbmc_srcloc)
     if match:
         path, line, func = match.groups()[:3]
         return make_srcloc(path, func, line, wkdir, root)
 
     # Source location in an intrinsic step may omit file and line
-    match = re.search('function (.+) thread', cbmc_srcloc)
+    match = INTRINSIC_SRCLOC.search(cbmc_srcloc)
     if match:
         path, func, line = '<intrinsic>', match.group(1), 0
         return make_srcloc(path, func, line, wkdir, root)
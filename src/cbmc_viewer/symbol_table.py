@@ -68,6 +68,9 @@ def parse_symbol(sym):
         return name
     return None
 
+# A location line with a file and line number
+LOCATION = re.compile('.* file (.*) line ([0-9]*)')
+
 def parse_location(loc, wkdir):
     """Symbol source location from location line."""
 
@@ -78,7 +81,7 @@ def parse_location(loc, wkdir):
     # Location....:
     # Location....: file file_name line line_number
 
-    match = re.match('.* file (.*) line ([0-9]*)', loc)
+    match = LOCATION.match(loc)
     if match is None:
         return None, None
 
@@ -3,11 +3,6 @@
 
 """Jinja templates."""
 
-import jinja2
-from jinja2 import select_autoescape
-
-import pkg_resources
-
 PACKAGE = 'cbmc_viewer'
 TEMPLATES = 'templates'
 
@@ -24,32 +19,62 @@ def env():
     global ENV
 
     if ENV is None:
+        # Import jinja and pkg_resources only when a page is rendered:
+        # together they take most of the viewer's startup time, and
+        # subcommands that only build json data never need them.
+        # pylint: disable=import-outside-toplevel
+        import jinja2
+        import pkg_resources
+
         template_dir = pkg_resources.resource_filename(PACKAGE, TEMPLATES)
+        # The templates are installed with the package and do not change
+        # while the viewer runs, so compile each template once and skip
+        # the check for a modified template file on every lookup.
         ENV = jinja2.Environment(
             loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=select_autoescape(
+            autoescape=jinja2.select_autoescape(
                 enabled_extensions=('html'),
-                default_for_string=True)
+                default_for_string=True),
+            auto_reload=False
         )
     return ENV
 
 def render_summary(summary):
     """Render summary as html."""
 
-    return env().get_template(SUMMARY_TEMPLATE).render(
-        summary=summary
-    )
+    return ''.join(stream_summary(summary))
 
 def render_code(filename, path_to_root, lines):
     """Render annotated source code as html."""
 
-    return env().get_template(CODE_TEMPLATE).render(
-        filename=filename, path_to_root=path_to_root, lines=lines
-    )
+    return ''.join(stream_code(filename, path_to_root, lines))
 
 def render_trace(name, desc, srcloc, steps):
     """Render annotated trace as html."""
 
-    return env().get_template(TRACE_TEMPLATE).render(
+    return ''.join(stream_trace(name, desc, srcloc, steps))
+
+################################################################
+# Render templates as a sequence of strings that can be written to a
+# file as they are generated, without holding the entire page in memory.
+
+def stream_summary(summary):
+    """Render summary as a sequence of html strings."""
+
+    return env().get_template(SUMMARY_TEMPLATE).generate(
+        summary=summary
+    )
+
+def stream_code(filename, path_to_root, lines):
+    """Render annotated source code as a sequence of html strings."""
+
+    return env().get_template(CODE_TEMPLATE).generate(
+        filename=filename, path_to_root=path_to_root, lines=lines
+    )
+
+def stream_trace(name, desc, srcloc, steps):
+    """Render annotated trace as a sequence of html strings."""
+
+    return env().get_template(TRACE_TEMPLATE).generate(
         prop_name=name, prop_desc=desc, prop_srcloc=srcloc, steps=steps
     )
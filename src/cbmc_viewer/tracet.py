@@ -124,7 +124,6 @@ class Trace:
     def __repr__(self):
         """A dict representation of traces."""
 
-        self.validate()
         return self.__dict__
 
     def __str__(self):
@@ -227,14 +226,19 @@ def parse_text_traces(textfile, root=None, wkdir=None):
 
     return traces
 
+# An assignment in a text trace, with or without a trailing binary
+# expression that may be an integer, a struct, or unknown ?
+TEXT_ASSIGNMENT_WITH_BINARY = re.compile(r'([^=]+)=(.+) \(([?{},01 ]+)\)')
+TEXT_ASSIGNMENT = re.compile('([^=]+)=(.+)')
+
 def parse_text_assignment(string):
     """Parse an assignment in a text trace."""
 
-    # trailing binary expression (exp) may be integer, struct, or unknown ?
-    match = re.match(r'([^=]+)=(.+) \(([?{},01 ]+)\)', string.strip())
+    string = string.strip()
+    match = TEXT_ASSIGNMENT_WITH_BINARY.match(string)
     if match:
         return list(match.groups()[:3])
-    match = re.match('([^=]+)=(.+)', string.strip())
+    match = TEXT_ASSIGNMENT.match(string)
     if match:
         return list(match.groups()[:2]) + [None]
     raise UserWarning(f"Can't parse assignment: {string}")
@@ -309,16 +313,16 @@ def parse_text_failure(block, root=None, wkdir=None):
 class TraceFromCbmcXml(Trace):
     """Load error traces from xml output of property checking."""
 
-    def __init__(self, xml_files, root):
+    def __init__(self, xml_files, root, parsed=None):
         root = srcloct.abspath(root)
         super().__init__(
-            [parse_xml_traces(xml_file, root) for xml_file in xml_files]
+            [parse_xml_traces(xml_file, root, parsed) for xml_file in xml_files]
         )
 
-def parse_xml_traces(xmlfile, root=None):
+def parse_xml_traces(xmlfile, root=None, parsed=None):
     """Parse a set of xml traces."""
 
-    xml = parse.parse_xml_file(xmlfile)
+    xml = parse.parse_file_once(parse.parse_xml_file, xmlfile, parsed)
     if xml is None:
         return {}
 
@@ -457,20 +461,21 @@ def parse_xml_location_only(step, root=None):
 class TraceFromCbmcJson(Trace):
     """Load error traces from json output of property checking."""
 
-    def __init__(self, json_files, root):
+    def __init__(self, json_files, root, parsed=None):
         root = srcloct.abspath(root)
         super().__init__(
-            [parse_json_traces(json_file, root) for json_file in json_files]
+            [parse_json_traces(json_file, root, parsed) for json_file in json_files]
         )
 
-def parse_json_traces(jsonfile, root=None):
+def parse_json_traces(jsonfile, root=None, parsed=None):
     """Parse a set of json traces."""
 
-    data = parse.parse_json_file(jsonfile)
+    data = parse.parse_file_once(parse.parse_json_file, jsonfile, parsed)
     if data is None:
         return {}
 
-    results = [entry['result'] for entry in data if 'result' in entry][0]
+    # Stop at the first entry with results instead of scanning the rest
+    results = next((entry['result'] for entry in data if 'result' in entry), [])
     traces = {result['property']: parse_json_trace(result['trace'], root)
               for result in results if 'trace' in result}
     return traces
@@ -588,13 +593,17 @@ def parse_json_location_only(step, root=None):
     _ = step
     _ = root
 
+# The spaces in a binary value, and the bytes formed by its bits
+BINARY_SPACE = re.compile(r'\s')
+BYTE = re.compile('[01]{8}')
+
 def binary_as_bytes(binary):
     """Reformat binary string as a sequence of bytes."""
 
     if not binary:
         return binary
-    bits = re.sub(r'\s', '', binary)
-    bites = re.findall('[01]{8}', bits)
+    bits = BINARY_SPACE.sub('', binary)
+    bites = BYTE.findall(bits)
     if bits != ''.join(bites):
         return binary
     return ' '.join(bites)
@@ -741,8 +750,12 @@ def fail(msg):
     logging.info(msg)
     raise UserWarning(msg)
 
-def make_trace(args):
-    """Implementation of make-trace"""
+def make_trace(args, parsed=None):
+    """Implementation of make-trace
+
+    The optional dict parsed holds cbmc output already parsed by the
+    caller (see parse.parse_file_once).
+    """
 
     viewer_trace, cbmc_trace, srcdir, wkdir = (
         args.viewer_trace, args.result, args.srcdir, args.wkdir)
@@ -753,22 +766,23 @@ def make_trace(args):
         fail(f"Expected json files: {viewer_trace}")
 
     if cbmc_trace and srcdir:
-        if filet.all_text_files(cbmc_trace):
+        file_type = filet.common_filetype(cbmc_trace)
+        if file_type == filet.File.TEXT:
             if wkdir:
                 return TraceFromCbmcText(cbmc_trace, srcdir, wkdir)
             fail("Expected --srcdir, --wkdir, and cbmc trace output.")
-        if filet.all_json_files(cbmc_trace):
-            return TraceFromCbmcJson(cbmc_trace, srcdir)
-        if filet.all_xml_files(cbmc_trace):
-            return TraceFromCbmcXml(cbmc_trace, srcdir)
+        if file_type == filet.File.JSON:
+            return TraceFromCbmcJson(cbmc_trace, srcdir, parsed)
+        if file_type == filet.File.XML:
+            return TraceFromCbmcXml(cbmc_trace, srcdir, parsed)
         fail(f"Expected json files or xml files, not both: {cbmc_trace}")
 
     return Trace()
 
-def make_and_save_trace(args, path=None):
+def make_and_save_trace(args, path=None, parsed=None):
     """Make trace object and write to file or stdout"""
 
-    obj = make_trace(args)
+    obj = make_trace(args, parsed)
     util.save(obj, path)
     return obj
 
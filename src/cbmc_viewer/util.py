@@ -5,6 +5,7 @@
 
 import logging
 import os
+import sys
 
 ################################################################
 
@@ -25,6 +26,19 @@ def choose(items):
 
 ################################################################
 
+def debugging():
+    """Return True if debugging output is enabled (as with --debug).
+
+    The markup objects (summary, annotated code, annotated traces) are
+    assembled from data that was validated as it was loaded, and a
+    report may contain thousands of them, so they validate themselves
+    against their schemas only when debugging.
+    """
+
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+################################################################
+
 def merge_dicts(dicts, handle_duplicate=None):
     """Merge a list of dictionaries.
 
@@ -56,16 +70,26 @@ def merge_dicts(dicts, handle_duplicate=None):
 def dump(data, filename=None, directory='.'):
     """Write data to a file or stdout."""
 
+    dump_stream([str(data)], filename, directory)
+
+def dump_stream(strings, filename=None, directory='.'):
+    """Write a sequence of strings to a file or stdout.
+
+    The strings are written as they are produced, so a large document
+    like a rendered html page need not be assembled in memory first.
+    The output is terminated with a newline, just as print() would.
+    """
+
     # directory defaults to '.' even if dump is called with directory=None
     directory = directory or '.'
 
     if filename:
         path = os.path.normpath(os.path.join(directory, filename))
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as fileobj:
-            print(data, file=fileobj)
+        write_file(strings, path)
     else:
-        print(data)
+        sys.stdout.writelines(strings)
+        sys.stdout.write('\n')
 
 def save(obj, path=None):
     """Save an object to a file or to stdout"""
@@ -74,8 +98,27 @@ def save(obj, path=None):
         print(obj)
         return
 
-    with open(path, 'w', encoding='utf-8') as output:
-        print(obj, file=output)
+    write_file([str(obj)], path)
     return
 
+# Buffer large writes: report pages and json files can be many megabytes
+WRITE_BUFFER_SIZE = 1 << 20
+
+def write_file(strings, path):
+    """Write a sequence of strings and a final newline to a file.
+
+    The strings are written to a temporary file that is renamed to
+    path when complete, so nobody ever sees a partially written file.
+    """
+
+    tmp = f'{path}.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as fileobj:
+            fileobj.writelines(strings)
+            fileobj.write('\n')
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
 ################################################################
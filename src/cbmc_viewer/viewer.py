@@ -86,14 +86,22 @@ def viewer(args):
     os.makedirs(jsondir, exist_ok=True)
     jsondir = Path(jsondir)
 
+    # Results and traces both come from the cbmc property checking
+    # output, so parse that output once and share it between them.
+    cbmc_output = {}
+
     progress("Scanning property checking results")
-    results = resultt.make_and_save_result(args, jsondir / 'viewer-result.json')
+    results = resultt.make_and_save_result(
+        args, jsondir / 'viewer-result.json', cbmc_output)
     progress("Scanning property checking results", True)
 
     progress("Scanning error traces")
-    traces = tracet.make_and_save_trace(args, jsondir / 'viewer-trace.json')
+    traces = tracet.make_and_save_trace(
+        args, jsondir / 'viewer-trace.json', cbmc_output)
     progress("Scanning error traces", True)
 
+    del cbmc_output # release the parsed output
+
     progress("Scanning coverage data")
     coverage = coveraget.make_and_save_coverage(args, jsondir / 'viewer-coverage.json')
     progress("Scanning coverage data", True)